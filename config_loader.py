@@ -31,7 +31,7 @@ def validate_env_value(name: str, value: str | None) -> str | None:
         return None
 
     # Strip any trailing comments and whitespace
-    cleaned_value = value.split('#')[0].strip()
+    cleaned_value = value.partition('#')[0].strip()
     return cleaned_value if cleaned_value else None
 
 def get_env_value(name: str, default: str | None = None) -> str | None:
@@ -103,6 +103,8 @@ def load_config_values() -> dict[str, Any]:
     # === Browser / Playwright ===
     config['HEADLESS_BROWSER'] = _get_typed_env_value('HEADLESS_BROWSER', True, bool)
     config['ROTATE_USER_AGENT'] = _get_typed_env_value('ROTATE_USER_AGENT', False, bool)
+    # Human-like interaction delays only matter when someone can watch the browser
+    config['SIMULATE_HUMAN'] = _get_typed_env_value('SIMULATE_HUMAN', not config['HEADLESS_BROWSER'], bool)
     config['DEFAULT_USER_AGENT'] = _get_typed_env_value(
         'DEFAULT_USER_AGENT',
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
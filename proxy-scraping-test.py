@@ -33,9 +33,9 @@ def scrape_with_iproyal_proxy():
         max_time_per_ip = int(os.getenv('MAX_TIME_PER_IP', '30'))  # seconds
         request_delay = float(os.getenv('REQUEST_DELAY', '2.0')) # Allow float for delay
         headless_mode = os.getenv('HEADLESS', 'false').lower() == 'true' # Optional headless for testing
-        logger.info(f"Test Config: Max Req/IP={max_requests_per_ip}, Max Time/IP={max_time_per_ip}s, Delay={request_delay}s, Headless={headless_mode}")
+        logger.info("Test Config: Max Req/IP=%d, Max Time/IP=%ds, Delay=%ss, Headless=%s", max_requests_per_ip, max_time_per_ip, request_delay, headless_mode)
     except ValueError as e:
-        logger.error(f"Invalid non-integer value for test config (MAX_REQUESTS_PER_IP, MAX_TIME_PER_IP, REQUEST_DELAY): {e}")
+        logger.error("Invalid non-integer value for test config (MAX_REQUESTS_PER_IP, MAX_TIME_PER_IP, REQUEST_DELAY): %s", e)
         return
 
     with sync_playwright() as p:
@@ -43,7 +43,7 @@ def scrape_with_iproyal_proxy():
         context = None
         try:
             # Launch browser with the obtained proxy_config
-            logger.info(f"Launching browser with proxy: {proxy_config['server']} (Headless: {headless_mode})")
+            logger.info("Launching browser with proxy: %s (Headless: %s)", proxy_config['server'], headless_mode)
             browser = p.chromium.launch(
                 proxy=proxy_config,
                 headless=headless_mode
@@ -71,7 +71,7 @@ def scrape_with_iproyal_proxy():
                     # cleans the browser state (cookies, etc.). Check IPRoyal docs for forced rotation.
                     if (request_count >= max_requests_per_ip or
                         (max_time_per_ip > 0 and time.time() - start_time >= max_time_per_ip)):
-                        logger.info(f"Rotation condition met (Requests: {request_count}/{max_requests_per_ip}, Time: {time.time() - start_time:.1f}/{max_time_per_ip}s). Recreating context...")
+                        logger.info("Rotation condition met (Requests: %d/%d, Time: %.1f/%ds). Recreating context...", request_count, max_requests_per_ip, time.time() - start_time, max_time_per_ip)
                         page.close()
                         context.close()
                         context = browser.new_context(proxy=proxy_config, ignore_https_errors=True)
@@ -80,14 +80,14 @@ def scrape_with_iproyal_proxy():
                         request_count = 0
                         logger.info("Context recreated.")
 
-                    logger.info(f"--- Request {request_count + 1} ---")
+                    logger.info("--- Request %d ---", request_count + 1)
 
                     # Get IP address using a reliable service
                     logger.debug("Navigating to icanhazip.com...")
                     page.goto("https://ipv4.icanhazip.com", timeout=20000)
                     # Simpler content extraction
                     current_ip = page.locator('pre').text_content().strip()
-                    logger.info(f"Current Exit IP: {current_ip}")
+                    logger.info("Current Exit IP: %s", current_ip)
 
                     # Get detailed IP info (optional, can add delay/complexity)
                     # logger.debug("Navigating to ipapi.co...")
@@ -102,29 +102,29 @@ def scrape_with_iproyal_proxy():
                     request_count += 1
 
                 except PlaywrightError as e:
-                     logger.error(f"Playwright error during request {request_count + 1} (IP: {current_ip}): {e}")
+                     logger.error("Playwright error during request %d (IP: %s): %s", request_count + 1, current_ip, e)
                      # Decide how to handle errors: break, continue, screenshot?
                      try:
                          page.screenshot(path=f"proxy_test_error_{request_count+1}.png")
                          logger.info("Saved error screenshot.")
                      except Exception as ss_err:
-                         logger.error(f"Failed to save error screenshot: {ss_err}")
+                         logger.error("Failed to save error screenshot: %s", ss_err)
                      # Maybe force context rotation on error?
                      request_count = max_requests_per_ip # Force rotation on next loop
 
                 except Exception as e:
-                     logger.error(f"Unexpected error during request {request_count + 1} (IP: {current_ip}): {e}", exc_info=True)
+                     logger.error("Unexpected error during request %d (IP: %s): %s", request_count + 1, current_ip, e, exc_info=True)
                      request_count = max_requests_per_ip # Force rotation
 
                 finally:
                      # Wait between requests, even after errors before potentially rotating
-                     logger.debug(f"Sleeping for {request_delay:.1f} seconds...")
+                     logger.debug("Sleeping for %.1f seconds...", request_delay)
                      time.sleep(request_delay)
 
         except KeyboardInterrupt:
             logger.info("Ctrl+C detected. Stopping...")
         except Exception as e:
-            logger.error(f"An uncaught error occurred in the main loop: {e}", exc_info=True)
+            logger.error("An uncaught error occurred in the main loop: %s", e, exc_info=True)
         finally:
             logger.info("Closing browser...")
             if context:
@@ -14,6 +14,12 @@ USER_KEYS: dict[str, str | None] = {
     "Joe": os.getenv("PUSHOVER_USER_KEY_JOE"),
     "Katie": os.getenv("PUSHOVER_USER_KEY_KATIE"),
 }
+# Comma-separated recipient list for user="All", joined once instead of per call
+ALL_USER_KEYS: str = ",".join(key for key in USER_KEYS.values() if key)
+
+PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+# Reused across notifications so repeated sends share one pooled TLS connection
+PUSHOVER_SESSION = requests.Session()
 
 
 def send_pushover_notification(
@@ -31,7 +37,7 @@ def send_pushover_notification(
     kwargs = {k: v for k, v in kwargs.items() if v is not None}
 
     if user not in USER_KEYS and user != "All":
-        logger.error(f"Invalid Pushover user specified: '{user}'. Must be 'Joe', 'Katie', or 'All'.")
+        logger.error("Invalid Pushover user specified: '%s'. Must be 'Joe', 'Katie', or 'All'.", user)
         # Decide whether to raise or just exit/return
         # raise ValueError("User must be 'Joe', 'Katie', or 'All'")
         return # Don't send if user is invalid
@@ -42,46 +48,34 @@ def send_pushover_notification(
         # Avoid sys.exit(1) if called as a library
         return
 
-    target_user_keys = []
     if user == "All":
-        if USER_KEYS.get("Joe"):
-            target_user_keys.append(USER_KEYS["Joe"])
-        if USER_KEYS.get("Katie"):
-            target_user_keys.append(USER_KEYS["Katie"])
-        if not target_user_keys:
+        target_user_key = ALL_USER_KEYS
+        if not target_user_key:
              logger.error("No user keys found for 'Joe' or 'Katie'. Cannot send notification.")
              return
     else:
-        user_key = USER_KEYS.get(user)
-        if not user_key:
-            logger.error(f"User key for '{user}' (PUSHOVER_USER_KEY_{user.upper()}) is not set. Cannot send notification.")
+        target_user_key = USER_KEYS.get(user)
+        if not target_user_key:
+            logger.error("User key for '%s' (PUSHOVER_USER_KEY_%s) is not set. Cannot send notification.", user, user.upper())
             return
-        target_user_keys.append(user_key)
 
     # Ensure message is not overly long (Pushover limit is 1024 bytes)
-    # Simple check, actual byte length can vary with encoding
-    if len(message.encode('utf-8')) > 1024: # Check byte length
-         logger.warning("Message length is potentially too long for Pushover (>1024 bytes), truncating.")
-         # Truncate based on bytes (more accurate)
-         encoded_message = message.encode('utf-8')[:1020] # Truncate slightly below limit
-         try:
-             message = encoded_message.decode('utf-8', errors='ignore') + "..."
-         except UnicodeDecodeError:
-             # Fallback if truncation broke a character
-             message = encoded_message.decode('utf-8', errors='replace') + "..."
-         logger.warning(f"Truncated message length: {len(message.encode('utf-8'))} bytes")
-
-
-    # The base data payload
+    # Encode once and reuse the bytes for both the length check and the truncation
+    encoded_message = message.encode('utf-8')
+    if len(encoded_message) > 1024: # Check byte length
+         logger.warning("Message is %d bytes, too long for Pushover (>1024 bytes), truncating.", len(encoded_message))
+         # Truncate slightly below limit; errors='ignore' drops a multi-byte character cut in half
+         message = encoded_message[:1020].decode('utf-8', errors='ignore') + "..."
+
+
+    # The base data payload, with optional parameters from kwargs merged in one step
     data: dict[str, Any] = {
         "token": PUSHOVER_API_TOKEN,
-        "user": ",".join(target_user_keys),
+        "user": target_user_key,
         "message": message,
+        **kwargs,
     }
 
-    # Add optional parameters from kwargs
-    data.update(kwargs)
-
     # Ensure boolean parameters are sent as 1 or 0 if present
     if 'html' in data:
         data['html'] = 1 if data['html'] else 0
@@ -94,12 +88,13 @@ def send_pushover_notification(
 
     # Send the POST request
     try:
-        logger.info(f"Sending Pushover notification to user(s): {user}")
-        logger.debug(f"Pushover payload (excluding token/user keys): "
-                       f"{ {k: v for k, v in data.items() if k not in ['token', 'user']} }")
+        logger.info("Sending Pushover notification to user(s): %s", user)
+        if logger.isEnabledFor(logging.DEBUG): # Skip building the filtered payload copy unless it will be logged
+            logger.debug("Pushover payload (excluding token/user keys): %s",
+                         {k: v for k, v in data.items() if k not in ['token', 'user']})
 
-        response = requests.post(
-            "https://api.pushover.net/1/messages.json",
+        response = PUSHOVER_SESSION.post(
+            PUSHOVER_API_URL,
             data=data,
             timeout=15 # Add a reasonable timeout
         )
@@ -128,11 +123,11 @@ def send_pushover_notification(
                   error_details = f"Status {status}, User Invalid: '{user_error}', Errors: {', '.join(errors)}"
              except ValueError: # Includes JSONDecodeError
                   # Response was not JSON, log raw text snippet
-                  error_details = f"Status {e.response.status_code}, Response: {e.response.text[:200]}..." # Log first 200 chars
-        logger.error(f"Error sending Pushover notification: {error_details}")
+                  error_details = f"Status {e.response.status_code}, Response: {e.response.content[:200].decode('utf-8', 'replace')}..." # Log first 200 chars
+        logger.error("Error sending Pushover notification: %s", error_details)
     except Exception as e:
         # Catch any other unexpected errors
-        logger.error(f"Unexpected error sending Pushover notification: {e}", exc_info=True)
+        logger.error("Unexpected error sending Pushover notification: %s", e, exc_info=True)
 
 
 
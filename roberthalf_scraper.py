@@ -1,24 +1,28 @@
 import argparse
 import contextlib
 import csv
+import heapq
+import html
+import http.cookiejar
 import json
 import logging
 import os
 import random
 import subprocess
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
 
-import pytz
 import requests
-from playwright.sync_api import (
-    Error as PlaywrightError,
-    TimeoutError as PlaywrightTimeoutError,
-    sync_playwright,
-)
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 
 from config_loader import load_prod_config
 from job_matcher_v2 import JobMatchAnalyzerV2
@@ -32,6 +36,17 @@ OUTPUT_DIR = Path("output")
 DOCS_DIR = Path("docs")
 CSV_FILE_PATH = OUTPUT_DIR / "job_data.csv"
 DEFAULT_SESSION_FILENAME = "session_data.json"
+REPORT_TIMEZONE = ZoneInfo("America/Chicago")  # Report timestamps are shown in CST/CDT
+JOB_SEARCH_URL = "https://www.roberthalf.com/bin/jobSearchServlet"
+
+# Login page URL and selectors
+LOGIN_URL = "https://online.roberthalf.com/s/login?app=0sp3w000001UJH5&c=US&d=en_US&language=en_US&redirect=false"
+LOGIN_USERNAME_SELECTOR = '[data-id="username"] input'
+LOGIN_PASSWORD_SELECTOR = '[data-id="password"] input'
+LOGIN_SUBMIT_SELECTOR = 'rhcl-button[data-id="signIn"]'
+LOGIN_ERROR_SELECTOR = 'div[role="alert"]:visible, .login-error:visible'
+# Resource types the login flow never needs; stylesheets are kept so visibility checks stay reliable
+LOGIN_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
 
 
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -78,6 +93,7 @@ SESSION_MAX_AGE_HOURS = config.get("SESSION_MAX_AGE_HOURS", 12)
 FILTER_STATE = config.get("FILTER_STATE", "TX")
 JOB_POST_PERIOD = config.get("JOB_POST_PERIOD", "PAST_24_HOURS")
 HEADLESS_BROWSER = config.get("HEADLESS_BROWSER", True)
+SIMULATE_HUMAN = config.get("SIMULATE_HUMAN", not HEADLESS_BROWSER)
 ROTATE_USER_AGENT = config.get("ROTATE_USER_AGENT", False)
 DEFAULT_USER_AGENT = config.get("DEFAULT_USER_AGENT", "Mozilla/5.0 (...)")
 REQUEST_DELAY_SECONDS = config.get("REQUEST_DELAY_SECONDS", 2.0)
@@ -90,6 +106,92 @@ TEST_MODE = config.get("TEST_MODE", False)
 GITHUB_ACCESS_TOKEN = config.get("GITHUB_ACCESS_TOKEN")
 GITHUB_PAGES_URL = config.get("GITHUB_PAGES_URL")
 PUSHOVER_ENABLED = config.get("PUSHOVER_ENABLED", False)
+ROBERTHALF_USERNAME = config.get("ROBERTHALF_USERNAME")
+ROBERTHALF_PASSWORD = config.get("ROBERTHALF_PASSWORD")
+
+
+def _build_requests_proxies(proxy_config_dict: dict[str, Any] | None) -> dict[str, str] | None:
+    """Translate the Playwright proxy settings into a requests-style proxies mapping."""
+    if not proxy_config_dict:
+        return None
+    # Use .get() for potentially missing keys
+    server_url = proxy_config_dict.get("server")
+    username = proxy_config_dict.get("username")
+    password = proxy_config_dict.get("password")
+    if not server_url:
+        logger.warning(
+            "Proxy config dictionary returned, but 'server' key is missing. No proxy used."
+        )
+        return None
+    try:
+        parsed_url = urlparse(server_url)
+    except ValueError as e:
+        logger.warning(f"Could not parse proxy server URL '{server_url}': {e}")
+        return None
+    # Ensure scheme is present for requests proxy format
+    scheme = parsed_url.scheme if parsed_url.scheme else "http"
+    auth = f"{username}:{password}@" if username and password else ""
+    proxy_url = f"{scheme}://{auth}{parsed_url.netloc}{parsed_url.path}"
+    logger.debug(f"Using proxy for requests ({'authenticated' if auth else 'no auth'})")
+    return {"http": proxy_url, "https": proxy_url}
+
+
+# Proxy settings are read from the environment once per run, not on every request
+PROXY_CONFIG = get_proxy_config()
+REQUESTS_PROXIES = _build_requests_proxies(PROXY_CONFIG)
+
+# One pooled HTTP session for every jobSearchServlet call, so keep-alive connections and TLS
+# sessions are reused across pages and retries instead of renegotiated per request
+API_SESSION = requests.Session()
+API_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+# Cookies are passed explicitly per request; don't let response cookies accumulate between calls
+API_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=()))
+
+# The local and remote streams page concurrently; this lock spaces their jobSearchServlet calls
+# at least REQUEST_DELAY_SECONDS apart so the combined request rate stays polite
+_API_RATE_LOCK = threading.Lock()
+_api_next_request_at = 0.0
+
+
+def _wait_for_api_slot() -> None:
+    """Block until REQUEST_DELAY_SECONDS have passed since the previous jobSearchServlet call."""
+    global _api_next_request_at
+    with _API_RATE_LOCK:
+        wait_time = _api_next_request_at - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        _api_next_request_at = time.monotonic() + REQUEST_DELAY_SECONDS
+
+# Static parts of every jobSearchServlet request; the user agent and page fields are filled per call
+JOB_SEARCH_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-language": "en-US,en;q=0.9",
+    "content-type": "application/json",
+    "origin": "https://www.roberthalf.com",
+    "referer": "https://www.roberthalf.com/us/en/jobs",
+}
+JOB_SEARCH_PAYLOAD = {
+    "country": "us",
+    "keywords": "",
+    "location": "",
+    "distance": "50",
+    "remote": "No",
+    "remoteText": "",
+    "languagecodes": [],
+    "source": ["Salesforce"],
+    "city": [],
+    "emptype": [],
+    "lobid": ["RHT"],
+    "jobtype": "",
+    "postedwithin": JOB_POST_PERIOD,
+    "timetype": "",
+    "pagesize": 25,
+    "pagenumber": 1,
+    "sortby": "PUBLISHED_DATE_DESC",
+    "mode": "",
+    "payratemin": 0,
+    "includedoe": "",
+}
 
 
 def get_user_agent() -> str:
@@ -106,11 +208,27 @@ def get_user_agent() -> str:
 
 
 def add_human_delay(min_seconds: float = 0.5, max_seconds: float = 1.5) -> None:
+    if not SIMULATE_HUMAN:
+        return
     delay = random.uniform(min_seconds, max_seconds)
-    logger.debug(f"Adding browser interaction delay of {delay:.2f} seconds")
+    logger.debug("Adding browser interaction delay of %.2f seconds", delay)
     time.sleep(delay)
 
 
+def _write_text_atomic(path: Path, chunks: Iterable[str]) -> None:
+    """Stream chunks to a sibling temp file and swap it into place with os.replace()."""
+    # A crash or error mid-write leaves the previous file intact instead of a truncated one
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
 def save_session_data(
     cookies: list[dict[str, Any]], user_agent: str, filename_path: Path = SESSION_FILE_PATH
 ) -> None:
@@ -118,14 +236,14 @@ def save_session_data(
         logger.info("Session saving is disabled.")
         return
     try:
-        filename_path.parent.mkdir(parents=True, exist_ok=True)
         session_data = {
             "cookies": cookies,
             "user_agent": user_agent,
             "timestamp": datetime.now(UTC).isoformat(),
         }
-        with open(filename_path, "w", encoding="utf-8") as f:  # Ensure UTF-8
-            json.dump(session_data, f, indent=2)
+        # Atomic write, so a crash never leaves a truncated session file (forcing a re-login)
+        # Compact JSON: the file is machine-only, so indentation just adds bytes to write and parse
+        _write_text_atomic(filename_path, [json.dumps(session_data, separators=(",", ":"))])
         logger.info(f"Session data saved to {filename_path.resolve()}")
     except Exception as e:
         logger.error(f"Failed to save session data to {filename_path.resolve()}: {e}")
@@ -167,13 +285,20 @@ def load_session_data(
 
 
 def login_and_get_session() -> tuple[list[dict[str, Any]], str] | None:
+    # Imported here so runs that reuse a saved session never pay for loading Playwright
+    from playwright.sync_api import (
+        Error as PlaywrightError,
+        TimeoutError as PlaywrightTimeoutError,
+        sync_playwright,
+    )
+
     logger.info("Starting login process with Playwright")
     session_user_agent = get_user_agent()
     logger.info(f"Using User Agent for login: {session_user_agent}")
 
     # Get credentials securely from global config
-    username = config.get("ROBERTHALF_USERNAME")
-    password = config.get("ROBERTHALF_PASSWORD")
+    username = ROBERTHALF_USERNAME
+    password = ROBERTHALF_PASSWORD
     if not username or not password:
         logger.error("ROBERTHALF_USERNAME or ROBERTHALF_PASSWORD not found.")
         return None  # Return None on credential error
@@ -182,7 +307,7 @@ def login_and_get_session() -> tuple[list[dict[str, Any]], str] | None:
     browser = None
     context = None
     with sync_playwright() as p:
-        proxy_config_dict = get_proxy_config()
+        proxy_config_dict = PROXY_CONFIG
         try:
             browser = p.chromium.launch(
                 proxy=proxy_config_dict, headless=HEADLESS_BROWSER, timeout=BROWSER_TIMEOUT_MS
@@ -196,33 +321,40 @@ def login_and_get_session() -> tuple[list[dict[str, Any]], str] | None:
                 ignore_https_errors=True,
             )
             context.set_default_navigation_timeout(BROWSER_TIMEOUT_MS)
+            context.route(
+                "**/*",
+                lambda route: route.abort()
+                if route.request.resource_type in LOGIN_BLOCKED_RESOURCE_TYPES
+                else route.continue_(),
+            )
             page = context.new_page()
             # ... (navigation, filling fields, clicking - add error handling) ...
-            login_url = "https://online.roberthalf.com/s/login?app=0sp3w000001UJH5&c=US&d=en_US&language=en_US&redirect=false"
-            logger.info(f"Navigating to login page: {login_url}")
-            page.goto(login_url, wait_until="domcontentloaded", timeout=BROWSER_TIMEOUT_MS)
+            logger.info(f"Navigating to login page: {LOGIN_URL}")
+            page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=BROWSER_TIMEOUT_MS)
             add_human_delay(2, 4)
 
-            username_field = page.locator('[data-id="username"] input')
+            username_field = page.locator(LOGIN_USERNAME_SELECTOR)
             username_field.wait_for(state="visible", timeout=15000)
             username_field.fill(username)
             add_human_delay()
 
-            password_field = page.locator('[data-id="password"] input')
+            password_field = page.locator(LOGIN_PASSWORD_SELECTOR)
             password_field.wait_for(state="visible", timeout=10000)
             password_field.fill(password)
             add_human_delay()
 
-            sign_in_button = page.locator('rhcl-button[data-id="signIn"]')
+            sign_in_button = page.locator(LOGIN_SUBMIT_SELECTOR)
             sign_in_button.click()
 
             try:
+                # The post-login URL is the success signal; don't also wait for every
+                # dashboard asset to finish loading before collecting cookies
                 page.wait_for_url(
-                    "**/s/myjobs", timeout=BROWSER_TIMEOUT_MS / 2
+                    "**/s/myjobs", wait_until="domcontentloaded", timeout=BROWSER_TIMEOUT_MS / 2
                 )
-                logger.info("Post-login URL reached or network idle.")
+                logger.info("Post-login URL reached.")
             except PlaywrightTimeoutError:
-                error_locator = page.locator('div[role="alert"]:visible, .login-error:visible')
+                error_locator = page.locator(LOGIN_ERROR_SELECTOR)
                 if error_locator.is_visible(timeout=2000):
                     error_text = (
                         error_locator.first.text_content(timeout=1000)
@@ -276,18 +408,19 @@ def login_and_get_session() -> tuple[list[dict[str, Any]], str] | None:
                 browser.close()
 
 
-def validate_session(cookies_list: list[dict[str, Any]], user_agent: str) -> bool:
+def build_cookie_jar(cookies_list: list[dict[str, Any]]) -> RequestsCookieJar:
+    """Build a cookie jar once per session for reuse across all API requests."""
+    cookie_jar = RequestsCookieJar()
+    for cookie in cookies_list:
+        # Domain is left unset on purpose: login cookies are issued for online.roberthalf.com
+        # but must also be sent to the www.roberthalf.com API
+        cookie_jar.set(cookie["name"], cookie["value"])
+    return cookie_jar
+
+
+def validate_session(cookie_jar: RequestsCookieJar, user_agent: str) -> bool:
     logger.info("Validating session cookies via API")
-    url = "https://www.roberthalf.com/bin/jobSearchServlet"
-    cookie_dict = {cookie["name"]: cookie["value"] for cookie in cookies_list}
-    headers = {  # ... headers ...
-        "accept": "application/json, text/plain, */*",
-        "accept-language": "en-US,en;q=0.9",
-        "content-type": "application/json",
-        "origin": "https://www.roberthalf.com",
-        "referer": "https://www.roberthalf.com/us/en/jobs",
-        "user-agent": user_agent,
-    }
+    headers = {**JOB_SEARCH_HEADERS, "user-agent": user_agent}
     payload = {  # ... minimal payload ...
         "country": "us",
         "keywords": "",
@@ -298,8 +431,13 @@ def validate_session(cookies_list: list[dict[str, Any]], user_agent: str) -> boo
         "source": ["Salesforce"],
     }
     try:
-        response = requests.post(
-            url, headers=headers, cookies=cookie_dict, json=payload, timeout=REQUEST_TIMEOUT_SECONDS
+        _wait_for_api_slot()
+        response = API_SESSION.post(
+            JOB_SEARCH_URL,
+            headers=headers,
+            cookies=cookie_jar,
+            json=payload,
+            timeout=REQUEST_TIMEOUT_SECONDS,
         )
         if 200 <= response.status_code < 300:
             try:
@@ -353,198 +491,132 @@ def filter_jobs_by_state(jobs: list[dict[str, Any]], state_code: str) -> list[di
 
 
 def fetch_jobs(
-    cookies_list: list[dict[str, Any]],
+    cookie_jar: RequestsCookieJar,
     user_agent: str,
     page_number: int = 1,
     is_remote: bool = False,
 ) -> dict[str, Any] | None:
-    url = "https://www.roberthalf.com/bin/jobSearchServlet"
-    cookie_dict = {cookie["name"]: cookie["value"] for cookie in cookies_list}
-    headers = {  # ... headers ...
-        "accept": "application/json, text/plain, */*",
-        "accept-language": "en-US,en;q=0.9",
-        "content-type": "application/json",
-        "origin": "https://www.roberthalf.com",
-        "referer": "https://www.roberthalf.com/us/en/jobs",
-        "user-agent": user_agent,
-    }
-    payload = {  # ... full payload ...
-        "country": "us",
-        "keywords": "",
-        "location": "",
-        "distance": "50",
+    headers = {**JOB_SEARCH_HEADERS, "user-agent": user_agent}
+    payload = {
+        **JOB_SEARCH_PAYLOAD,
         "remote": "yes" if is_remote else "No",
-        "remoteText": "",
-        "languagecodes": [],
-        "source": ["Salesforce"],
-        "city": [],
-        "emptype": [],
-        "lobid": ["RHT"],
-        "jobtype": "",
-        "postedwithin": JOB_POST_PERIOD,
-        "timetype": "",
-        "pagesize": 25,
         "pagenumber": page_number,
-        "sortby": "PUBLISHED_DATE_DESC",
-        "mode": "",
-        "payratemin": 0,
-        "includedoe": "",
     }
-    proxies = None
-    proxy_config_dict = get_proxy_config()
-    if proxy_config_dict:
-        # Use .get() for potentially missing keys
-        server_url = proxy_config_dict.get("server")
-        username = proxy_config_dict.get("username")
-        password = proxy_config_dict.get("password")
-
-        if server_url:
-            if username and password:
-                auth = f"{username}:{password}"
-                try:
-                    parsed_url = urlparse(server_url)
-                    # Ensure scheme is present for requests proxy format
-                    scheme = parsed_url.scheme if parsed_url.scheme else "http"
-                    proxy_url_with_auth = f"{scheme}://{auth}@{parsed_url.netloc}{parsed_url.path}"
-                    proxies = {"http": proxy_url_with_auth, "https": proxy_url_with_auth}
-                    logger.debug("Using authenticated proxy for requests")
-                except ValueError as e:
-                    logger.warning(f"Could not parse proxy server URL '{server_url}': {e}")
-            else:
-                 # Ensure scheme is present for requests proxy format
-                try:
-                    parsed_url = urlparse(server_url)
-                    scheme = parsed_url.scheme if parsed_url.scheme else "http"
-                    proxy_url_no_auth = f"{scheme}://{parsed_url.netloc}{parsed_url.path}"
-                    proxies = {"http": proxy_url_no_auth, "https": proxy_url_no_auth}
-                    logger.debug("Using proxy for requests (no auth)")
-                except ValueError as e:
-                     logger.warning(f"Could not parse proxy server URL '{server_url}': {e}")
-        else:
-            logger.warning("Proxy config dictionary returned, but 'server' key is missing. No proxy used.")
 
     response = None # Initialize response before try block
     try:
-        logger.info(f"Fetching {'remote' if is_remote else 'local'} jobs page {page_number}")
-        response = requests.post(
-            url,
+        logger.info("Fetching %s jobs page %d", "remote" if is_remote else "local", page_number)
+        _wait_for_api_slot()
+        response = API_SESSION.post(
+            JOB_SEARCH_URL,
             headers=headers,
-            cookies=cookie_dict,
+            cookies=cookie_jar,
             json=payload,
             timeout=REQUEST_TIMEOUT_SECONDS,
-            proxies=proxies,
+            proxies=REQUESTS_PROXIES,
         )
         response.raise_for_status()
         return response.json()  # Directly return parsed JSON
     except json.JSONDecodeError:
         status_code = response.status_code if response is not None else "N/A"
-        response_text = response.text[:200] if response is not None else "N/A"
+        response_text = (
+            response.content[:200].decode("utf-8", "replace") if response is not None else "N/A"
+        )
         logger.warning(
-            f"Failed to parse API response as JSON (Status: {status_code}). Body: {response_text}..."
+            "Failed to parse API response as JSON (Status: %s). Body: %s...",
+            status_code,
+            response_text,
         )
         return None
     except requests.exceptions.HTTPError as http_err:
         status_code = http_err.response.status_code
         if status_code in (401, 403):
-            logger.warning(f"HTTP {status_code} error suggests session is invalid.")
+            logger.warning("HTTP %s error suggests session is invalid.", status_code)
         else:
-            logger.error(f"HTTP error fetching jobs page {page_number}: {http_err}")
+            logger.error("HTTP error fetching jobs page %d: %s", page_number, http_err)
         return None
     except requests.exceptions.RequestException as req_err:
-        logger.error(f"Network error fetching jobs page {page_number}: {req_err}")
+        logger.error("Network error fetching jobs page %d: %s", page_number, req_err)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error fetching jobs page {page_number}: {e}", exc_info=True)
+        logger.error("Unexpected error fetching jobs page %d: %s", page_number, e, exc_info=True)
         return None
 
 
 def fetch_with_retry(
-    cookies_list: list[dict[str, Any]], user_agent: str, page_number: int, is_remote: bool = False
+    cookie_jar: RequestsCookieJar,
+    user_agent: str,
+    page_number: int,
+    is_remote: bool = False,
+    stop_event: threading.Event | None = None,
 ) -> dict[str, Any] | None:
+    """Fetch a page, retrying with backoff; gives up early (returning None) once stop_event is set."""
     base_wait_time = 5
     for attempt in range(MAX_RETRIES):
-        result = fetch_jobs(cookies_list, user_agent, page_number, is_remote)
+        if stop_event is not None and stop_event.is_set():
+            return None
+        result = fetch_jobs(cookie_jar, user_agent, page_number, is_remote)
         if result is not None:
             return result
         wait_time = base_wait_time * (2**attempt) + random.uniform(
             0, base_wait_time / 2
         )  # Adjusted jitter
         logger.warning(
-            f"API fetch attempt {attempt + 1}/{MAX_RETRIES} failed. Retrying in {wait_time:.2f}s..."
+            "API fetch attempt %d/%d failed. Retrying in %.2fs...",
+            attempt + 1,
+            MAX_RETRIES,
+            wait_time,
         )
-        time.sleep(wait_time)
-    logger.error(f"All {MAX_RETRIES} retry attempts failed for page {page_number}.")
+        if stop_event is not None:
+            stop_event.wait(wait_time)  # Wakes immediately if the fetch is abandoned
+        else:
+            time.sleep(wait_time)
+    logger.error("All %d retry attempts failed for page %d.", MAX_RETRIES, page_number)
     return None
 
 
-def _generate_html_report(
-    jobs_list: list[dict[str, Any]],
-    timestamp: str,
-    total_found: int,
-    state_filter: str,
-    job_period: str,
-    new_job_ids: set[str],
-) -> str:
-    num_tx_jobs = len([job for job in jobs_list if job.get("stateprovince") == state_filter])
-    num_remote_jobs = len([job for job in jobs_list if job.get("remote", "").lower() == "yes"])
-    num_new_jobs = len(new_job_ids)
-
-    # Convert UTC timestamp to CST/CDT
-    cst = pytz.timezone("America/Chicago")
-    try:
-        dt_utc = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        dt_cst = dt_utc.astimezone(cst)
-        formatted_timestamp = dt_cst.strftime("%Y-%m-%d %H:%M:%S %Z")
-    except ValueError:
-        formatted_timestamp = timestamp  # Fallback
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Robert Half Job Report ({state_filter}) - {formatted_timestamp}</title>
-    <style>
-        /* Basic styles from the old version */
-        body {{ font-family: sans-serif; margin: 20px; }}
-        h1 {{ color: #333; }}
-        p {{ color: #555; }}
-        table {{
+# --- HTML Report Templates ---
+# Static parts of docs/jobs.html, built once at import instead of on every report
+REPORT_CSS = """        /* Basic styles from the old version */
+        body { font-family: sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        p { color: #555; }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
-        th, td {{
+        }
+        th, td {
             border: 1px solid #ddd;
             padding: 8px;
             text-align: left;
             vertical-align: top;
-        }}
-        th {{ background-color: #f2f2f2; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        a {{ color: #007bff; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-        .pay-rate, .location {{ white-space: nowrap; }}
+        }
+        th { background-color: #f2f2f2; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        a { color: #007bff; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        .pay-rate, .location { white-space: nowrap; }
 
         /* Styling for the expandable content */
-        .job-row {{
+        .job-row {
             cursor: pointer;
-        }}
-        .job-row:hover {{
+        }
+        .job-row:hover {
             background-color: #f0f8ff; /* AliceBlue on hover */
-        }}
-        .job-description {{
+        }
+        .job-description {
             padding: 15px;
             background-color: #fff;
             border-top: none;
             margin-top: 0;
-        }}
-        .description-container {{
+        }
+        .description-container {
             padding: 0;
             border-top: none;
             background-color: #fff;
-        }}
-        .job-row .expander {{
+        }
+        .job-row .expander {
             display: inline-block;
             width: 20px;
             height: 20px;
@@ -555,13 +627,13 @@ def _generate_html_report(
             background-color: #f2f2f2; /* Light gray background for expander */
             font-weight: bold;
             font-size: 14px;
-        }}
+        }
 
         /* Styling for new job highlighting */
-        .new-job .title-cell {{
+        .new-job .title-cell {
             background-color: #f0fff0; /* Honeydew for new job title cell */
-        }}
-        .new-tag {{
+        }
+        .new-tag {
             display: inline-block;
             background-color: #28a745; /* Green background for NEW tag */
             color: white;
@@ -571,28 +643,38 @@ def _generate_html_report(
             border-radius: 4px;
             margin-right: 5px;
             vertical-align: middle;
-        }}
+        }
 
         /* Styles for LLM analysis elements */
-        .score-badge {{ /* Style for score */
+        .score-badge { /* Style for score */
             display: inline-block; padding: 2px 5px; margin-right: 5px;
             font-size: 0.8em; border-radius: 4px; color: white;
-        }}
-        .score-high {{ background-color: #28a745; }} /* Green */
-        .score-medium {{ background-color: #ffc107; color: #333; }} /* Yellow */
-        .score-low {{ background-color: #6c757d; }} /* Gray */
-        .recommendation {{ font-weight: bold; margin-right: 5px; }}
-        .rec-apply {{ color: #28a745; }}
-        .rec-consider {{ color: #ffc107; }}
-        .rec-skip {{ color: #6c757d; }}
-        .analysis-summary {{ font-style: italic; color: #555; font-size: 0.9em; margin-top: 5px; }}
+        }
+        .score-high { background-color: #28a745; } /* Green */
+        .score-medium { background-color: #ffc107; color: #333; } /* Yellow */
+        .score-low { background-color: #6c757d; } /* Gray */
+        .recommendation { font-weight: bold; margin-right: 5px; }
+        .rec-apply { color: #28a745; }
+        .rec-consider { color: #ffc107; }
+        .rec-skip { color: #6c757d; }
+        .analysis-summary { font-style: italic; color: #555; font-size: 0.9em; margin-top: 5px; }"""
+
+# Page head, summary and table header; REPORT_CSS is passed in as a field since it contains braces
+REPORT_HEADER_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Robert Half Job Report ({state_filter}) - {formatted_timestamp}</title>
+    <style>
+{report_css}
     </style>
 </head>
 <body>
     <h1>Robert Half Job Report</h1>
     <p>Generated: {formatted_timestamp}</p>
-    <p>Filters: State = {state_filter}, Posted Within = {job_period.replace("_", " ")}</p>
-    <p>Found {num_tx_jobs} jobs in {state_filter} and {num_remote_jobs} remote jobs (Total Unique: {len(jobs_list)}). Identified <span style="background-color: #f0fff0; padding: 1px 3px; border: 1px solid #ccc;">{num_new_jobs} New Jobs</span> since last CSV entry. API reported {total_found} total jobs matching period.</p>
+    <p>Filters: State = {state_filter}, Posted Within = {job_period}</p>
+    <p>Found {num_tx_jobs} jobs in {state_filter} and {num_remote_jobs} remote jobs (Total Unique: {total_unique}). Identified <span style="background-color: #f0fff0; padding: 1px 3px; border: 1px solid #ccc;">{num_new_jobs} New Jobs</span> since last CSV entry. API reported {total_found} total jobs matching period.</p>
 
     <table id="jobTable">
         <thead>
@@ -606,6 +688,126 @@ def _generate_html_report(
         </thead>
         <tbody>
 """
+
+REPORT_NO_DESCRIPTION_HTML = "No description available."
+
+REPORT_EMPTY_ROW_HTML = '<tr><td colspan="5">No jobs found matching the current filters.</td></tr>\n'
+
+# Job row plus its hidden description row, one line per job with no indentation: the report is
+# rewritten, committed and served on every run, so per-row whitespace is pure overhead
+REPORT_ROW_TEMPLATE = (
+    '<tr class="{row_class}" data-job-id="{idx}">'
+    '<td class="title-cell"><span class="expander">+</span> {analysis_html}{new_indicator_html}'
+    '<a href="{job_url}" target="_blank">{title}</a></td>'
+    '<td class="location">{location_str}</td>'
+    '<td class="pay-rate">{pay_rate_str}</td>'
+    "<td>{job_id}</td>"
+    "<td>{posted_date_str}</td></tr>"
+    '<tr class="description-row" id="job-{idx}" style="display:none;">'
+    '<td colspan="5" class="description-container">'
+    '<div class="job-description">{description_html}</div></td></tr>\n'
+)
+
+REPORT_FOOTER_HTML = """
+        </tbody>
+    </table>
+    <script>
+        document.addEventListener('DOMContentLoaded', function() {
+            const jobRows = document.querySelectorAll('.job-row');
+            jobRows.forEach(row => {
+                row.addEventListener('click', function(event) {
+                    // Prevent toggling if clicking on the link itself
+                    if (event.target.tagName === 'A') {
+                        return;
+                    }
+                    const jobId = this.getAttribute('data-job-id');
+                    const descriptionRow = document.getElementById('job-' + jobId);
+                    const expander = this.querySelector('.expander');
+
+                    if (descriptionRow && expander) { // Check if elements exist
+                         if (descriptionRow.style.display === 'none') {
+                            descriptionRow.style.display = 'table-row';
+                            expander.textContent = '-';
+                         } else {
+                            descriptionRow.style.display = 'none';
+                            expander.textContent = '+';
+                         }
+                    }
+                });
+            });
+        });
+    </script>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=4096)
+def _format_pay_range(pay_min_str: str, pay_max_str: str) -> str | None:
+    """Format raw API pay bounds as "$min - $max", or None if they are not numeric.
+
+    Shared by the HTML report, the notification and the CSV; the same rates recur across many
+    postings, so each distinct pair is only converted once.
+    """
+    try:
+        return f"${int(float(pay_min_str)):,} - ${int(float(pay_max_str)):,}"
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _format_posted_date(date_posted: str) -> str:
+    """Format an API posted date in the report timezone; many jobs share the same timestamp."""
+    try:
+        posted_dt = datetime.fromisoformat(date_posted.replace("Z", "+00:00")).astimezone(
+            REPORT_TIMEZONE
+        )
+        return posted_dt.strftime("%Y-%m-%d %H:%M %Z")
+    except ValueError:
+        return html.escape(date_posted)
+
+
+def _iter_html_report(
+    jobs_list: list[dict[str, Any]],
+    timestamp: str,
+    total_found: int,
+    num_tx_jobs: int,
+    num_remote_jobs: int,
+    state_filter: str,
+    job_period: str,
+    new_job_ids: set[str],
+) -> Iterator[str]:
+    """Yield the HTML report in document order so it can be streamed to a file.
+
+    The state and remote counts come from the caller's single pass over jobs_list.
+    """
+    num_new_jobs = len(new_job_ids)
+
+    # Convert UTC timestamp to CST/CDT
+    try:
+        dt_utc = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        dt_cst = dt_utc.astimezone(REPORT_TIMEZONE)
+        formatted_timestamp = dt_cst.strftime("%Y-%m-%d %H:%M:%S %Z")
+    except ValueError:
+        formatted_timestamp = timestamp  # Fallback
+
+    yield REPORT_HEADER_TEMPLATE.format(
+        report_css=REPORT_CSS,
+        state_filter=state_filter,
+        formatted_timestamp=formatted_timestamp,
+        job_period=job_period.replace("_", " "),
+        num_tx_jobs=num_tx_jobs,
+        num_remote_jobs=num_remote_jobs,
+        total_unique=len(jobs_list),
+        num_new_jobs=num_new_jobs,
+        total_found=total_found,
+    )
+    if not jobs_list:
+        # Keep the table well-formed with a single explanatory row instead of an empty tbody
+        yield REPORT_EMPTY_ROW_HTML
+        yield REPORT_FOOTER_HTML
+        return
+
     # Sort jobs: New > High Score > Date Posted > Title
     jobs_list.sort(
         key=lambda x: (
@@ -627,34 +829,28 @@ def _generate_html_report(
     )
 
     for idx, job in enumerate(jobs_list, 1):
-        title = job.get("jobtitle", "N/A")
+        # Plain-text API fields are escaped; the description is API-provided markup. Values are
+        # coerced with str() first since the API may send numbers (e.g. a numeric job number)
+        title = html.escape(str(job.get("jobtitle") or "N/A"))
         city = job.get("city", "N/A")
         state = job.get("stateprovince", "")
         is_remote = job.get("remote", "").lower() == "yes"
-        job_id = job.get("unique_job_number", "N/A")
-        job_url = job.get("job_detail_url", "#")
-        location_str = f"{city}, {state}" if not is_remote else "Remote (US)"
+        job_id = html.escape(str(job.get("unique_job_number") or "N/A"))
+        job_url = html.escape(str(job.get("job_detail_url") or "#"))
+        location_str = html.escape(f"{city}, {state}") if not is_remote else "Remote (US)"
         pay_rate_str = "N/A"  # ... (pay rate formatting logic) ...
         if pay_min_str := job.get("payrate_min"):
             pay_max_str = job.get("payrate_max")
-            pay_period = job.get("payrate_period", "").lower()
+            pay_period = html.escape(str(job.get("payrate_period") or "").lower())
             if pay_max_str and pay_period:
-                try:
-                    pay_min = int(float(pay_min_str))
-                    pay_max = int(float(pay_max_str))
-                    pay_rate_str = f"${pay_min:,} - ${pay_max:,} / {pay_period}"
-                except (ValueError, TypeError):
-                    pay_rate_str = f"{pay_min_str} - {pay_max_str} ({pay_period})"
-
-        posted_date_str = "N/A"  # ... (date formatting logic) ...
-        if date_posted := job.get("date_posted"):
-            try:
-                posted_dt = datetime.fromisoformat(date_posted.replace("Z", "+00:00")).astimezone(
-                    cst
-                )
-                posted_date_str = posted_dt.strftime("%Y-%m-%d %H:%M %Z")
-            except ValueError:
-                posted_date_str = date_posted
+                if pay_range := _format_pay_range(pay_min_str, pay_max_str):
+                    pay_rate_str = f"{pay_range} / {pay_period}"
+                else:
+                    raw_range = html.escape(f"{pay_min_str} - {pay_max_str}")
+                    pay_rate_str = f"{raw_range} ({pay_period})"
+
+        date_posted = job.get("date_posted")
+        posted_date_str = _format_posted_date(date_posted) if date_posted else "N/A"
 
         is_new = job.get("is_new", False)  # Use the flag added earlier
         new_indicator_html = '<span class="new-tag">NEW</span> ' if is_new else ""
@@ -701,7 +897,7 @@ def _generate_html_report(
 
                 summary = tier2_result.get("summary", "")
                 if summary:
-                    analysis_summary_text = f'<p class="analysis-summary"><strong>AI Summary:</strong> {summary}</p><hr>'
+                    analysis_summary_text = f'<p class="analysis-summary"><strong>AI Summary:</strong> {html.escape(str(summary))}</p><hr>'
             else:
                 # Handle case where Tier 2 failed or was skipped (analysis exists but tier2_result is None)
                 reco_html = '<span style="color: gray; font-size: 0.8em;">No Reco</span> '
@@ -714,7 +910,7 @@ def _generate_html_report(
         elif isinstance(analysis, dict) and "error" in analysis:
             # Handle the case where the analysis dict itself indicates an error
             analysis_html = '<span style="color: red; font-size: 0.8em;">Analysis Error</span>'
-            analysis_summary_text = f'<p class="analysis-summary"><em>Error during analysis: {analysis.get("error", "Unknown")}</em></p><hr>'
+            analysis_summary_text = f'<p class="analysis-summary"><em>Error during analysis: {html.escape(str(analysis.get("error", "Unknown")))}</em></p><hr>'
         else:
             # Handle case where analysis is None (job wasn't analyzed)
             analysis_html = (
@@ -722,60 +918,39 @@ def _generate_html_report(
             )
             analysis_summary_text = ""  # No summary needed
 
-        html_content += f"""
-            <tr class="{row_class}" data-job-id="{idx}">
-                <td class="title-cell"><span class="expander">+</span> {analysis_html}{new_indicator_html}<a href="{job_url}" target="_blank">{title}</a></td>
-                <td class="location">{location_str}</td>
-                <td class="pay-rate">{pay_rate_str}</td>
-                <td>{job_id}</td>
-                <td>{posted_date_str}</td>
-            </tr>"""
-
-        description_html = job.get("description", "No description available.")
-        description_html = analysis_summary_text + description_html
-
-        html_content += f"""
-            <tr class="description-row" id="job-{idx}" style="display:none;">
-                <td colspan="5" class="description-container">
-                    <div class="job-description">
-                        {description_html}
-                    </div>
-                </td>
-            </tr>
-"""
-    html_content += """
-        </tbody>
-    </table>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            const jobRows = document.querySelectorAll('.job-row');
-            jobRows.forEach(row => {
-                row.addEventListener('click', function(event) {
-                    // Prevent toggling if clicking on the link itself
-                    if (event.target.tagName === 'A') {
-                        return;
-                    }
-                    const jobId = this.getAttribute('data-job-id');
-                    const descriptionRow = document.getElementById('job-' + jobId);
-                    const expander = this.querySelector('.expander');
+        description_html = job.get("description") or REPORT_NO_DESCRIPTION_HTML
+
+        yield REPORT_ROW_TEMPLATE.format(
+            idx=idx,
+            row_class=row_class,
+            analysis_html=analysis_html,
+            new_indicator_html=new_indicator_html,
+            job_url=job_url,
+            title=title,
+            location_str=location_str,
+            pay_rate_str=pay_rate_str,
+            job_id=job_id,
+            posted_date_str=posted_date_str,
+            description_html=analysis_summary_text + description_html,
+        )
+    yield REPORT_FOOTER_HTML
 
-                    if (descriptionRow && expander) { // Check if elements exist
-                         if (descriptionRow.style.display === 'none') {
-                            descriptionRow.style.display = 'table-row';
-                            expander.textContent = '-';
-                         } else {
-                            descriptionRow.style.display = 'none';
-                            expander.textContent = '+';
-                         }
-                    }
-                });
-            });
-        });
-    </script>
-</body>
-</html>
-"""
-    return html_content
+
+# --- Pushover Notification Templates ---
+NOTIFY_RECO_HTML = {
+    "apply": '<font color="#28a745">Apply!</font> ',
+    "consider": '<font color="#ffc107">Consider</font> ',
+}
+NOTIFY_RECO_SKIP_HTML = '<font color="#6c757d">Skip</font> '
+NOTIFY_RECO_ERROR_HTML = '<font color="#dc3545">Error</font> '
+NOTIFY_PAY_TEMPLATE = "\n  {pay_range}/{pay_period}"
+
+
+def _notification_sort_score(job: dict[str, Any]) -> float:
+    """Sort key for the notification: the calculated match score, or -1 if there is none."""
+    analysis = job.get("match_analysis")
+    score = analysis.get("final_score_calculated") if analysis else None
+    return -1 if score is None else score
 
 
 def _find_latest_json_report(
@@ -864,11 +1039,15 @@ def _commit_and_push_report(
 
     # Add, Commit, Push logic using _run_git_command...
     logger.info(f"Changes detected in {html_rel_path_str}. Proceeding with Git operations.")
-    add_ok, _, _ = _run_git_command(["git", "add", html_rel_path_str], cwd=repo_dir)
-    if not add_ok:
-        return  # Error logged in helper
-
-    commit_ok, _, _ = _run_git_command(["git", "commit", "-m", commit_message], cwd=repo_dir)
+    # A tracked report is committed directly by pathspec; only a brand-new one needs `git add`
+    if stdout.startswith("??"):
+        add_ok, _, _ = _run_git_command(["git", "add", html_rel_path_str], cwd=repo_dir)
+        if not add_ok:
+            return  # Error logged in helper
+
+    commit_ok, _, _ = _run_git_command(
+        ["git", "commit", "-m", commit_message, "--", html_rel_path_str], cwd=repo_dir
+    )
     if not commit_ok:
         return  # Error logged in helper
 
@@ -880,23 +1059,13 @@ def _commit_and_push_report(
         remote_url_ok, remote_url, _ = _run_git_command(
             ["git", "remote", "get-url", "--push", "origin"], cwd=repo_dir
         )
-        if remote_url_ok and remote_url and remote_url.startswith("https"):
-            branch_ok, current_branch, _ = _run_git_command(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir
-            )
-            if branch_ok and current_branch:
-                try:
-                    parsed = urlparse(remote_url)
-                    auth_url = f"https://{git_token}@{parsed.netloc}{parsed.path}"
-                    push_command = ["git", "push", auth_url, current_branch]
-                    sensitive_push = True
-                    logger.info("Using token authentication for git push.")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to construct authenticated push URL: {e}. Falling back."
-                    )
-            else:
-                logger.warning("Could not get current branch. Falling back.")
+        if remote_url_ok and remote_url and remote_url.startswith("https://"):
+            # Splice the token in after the scheme; the rest of the remote URL is reused as-is
+            auth_url = f"https://{git_token}@{remote_url[len('https://'):]}"
+            # Pushing HEAD targets the current branch without a rev-parse lookup
+            push_command = ["git", "push", auth_url, "HEAD"]
+            sensitive_push = True
+            logger.info("Using token authentication for git push.")
         else:
             logger.warning("Remote URL is not HTTPS or not found. Falling back.")
     else:
@@ -925,17 +1094,21 @@ def save_job_results(
     iso_timestamp_str = timestamp_dt.isoformat(timespec="seconds").replace("+00:00", "Z")
 
     state_filter = config.get("FILTER_STATE", "N/A")
+    state_filter_lower = state_filter.lower()  # Used in the report filename and summary key
     job_period = config.get("JOB_POST_PERIOD", "N/A")
     test_mode = config.get("TEST_MODE", False)
     pushover_enabled = config.get("PUSHOVER_ENABLED", False)
     github_pages_url = config.get("GITHUB_PAGES_URL")
 
-    # Count TX and remote jobs after potential filtering
-    tx_jobs = [job for job in jobs_list if job.get("stateprovince") == state_filter]
-    remote_jobs = [job for job in jobs_list if job.get("remote", "").lower() == "yes"]
-
+    # Flag new jobs and count TX and remote jobs in a single pass over the list
+    num_tx_jobs = 0
+    num_remote_jobs = 0
     for job in jobs_list:
         job["is_new"] = job.get("unique_job_number") in new_job_ids
+        if job.get("stateprovince") == state_filter:
+            num_tx_jobs += 1
+        if job.get("remote", "").lower() == "yes":
+            num_remote_jobs += 1
 
     # --- Evaluate Job Matches ---
     if analyzer:
@@ -974,13 +1147,13 @@ def save_job_results(
             job["match_analysis"] = None  # Ensure key exists
 
     # --- Save JSON Results ---
-    json_filename = f"{filename_prefix}_{state_filter.lower()}_jobs_{timestamp_str}.json"
+    json_filename = f"{filename_prefix}_{state_filter_lower}_jobs_{timestamp_str}.json"
     json_output_file_path = output_dir / json_filename
     results_data = {
         "jobs": jobs_list,
         "timestamp": iso_timestamp_str,
-        f"total_{state_filter.lower()}_jobs": len(tx_jobs),
-        "total_remote_jobs": len(remote_jobs),
+        f"total_{state_filter_lower}_jobs": num_tx_jobs,
+        "total_remote_jobs": num_remote_jobs,
         "total_new_jobs": len(new_job_ids),
         "total_jobs_found_in_period": total_found,
         "job_post_period_filter": job_period,
@@ -988,8 +1161,12 @@ def save_job_results(
         "status": "Completed",
     }
     try:
-        with open(json_output_file_path, "w", encoding="utf-8") as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False)
+        # Same chunks json.dump() would write, but published atomically so a failed run never
+        # leaves a truncated report behind
+        _write_text_atomic(
+            json_output_file_path,
+            json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(results_data),
+        )
         logger.info(f"Saved {len(jobs_list)} jobs results to {json_output_file_path.resolve()}")
     except Exception as e:
         logger.error(f"Failed to save JSON results: {e}")
@@ -999,11 +1176,19 @@ def save_job_results(
     html_output_file_path = docs_dir / html_filename
     try:
         # Pass new_job_ids to the HTML generator
-        html_content = _generate_html_report(
-            jobs_list, iso_timestamp_str, total_found, state_filter, job_period, new_job_ids
+        _write_text_atomic(
+            html_output_file_path,
+            _iter_html_report(
+                jobs_list,
+                iso_timestamp_str,
+                total_found,
+                num_tx_jobs,
+                num_remote_jobs,
+                state_filter,
+                job_period,
+                new_job_ids,
+            ),
         )
-        with open(html_output_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
         logger.info(f"Generated HTML report at: {html_output_file_path.resolve()}")
 
         # --- Commit and Push HTML Report ---
@@ -1045,18 +1230,15 @@ def save_job_results(
                 logger.warning("AI Matching failed. Falling back to notifying about all new jobs.")
 
         if len(jobs_to_notify) > 0 or test_mode:
-            # Sort by calculated score (descending), handle None scores
-            jobs_to_notify.sort(
-                key=lambda x: x.get("match_analysis", {}).get("final_score_calculated", -1)
-                if x.get("match_analysis")
-                else -1,
-                reverse=True,
-            )
-
             # Format notification message
             job_details_notify = []
             max_jobs_in_notification = 5
-            for job in jobs_to_notify[:max_jobs_in_notification]:
+            # Only the top few by calculated score are shown, so select them without sorting the
+            # whole list; unscored jobs (no analysis, or a failed score calculation) rank last
+            top_jobs_notify = heapq.nlargest(
+                max_jobs_in_notification, jobs_to_notify, key=_notification_sort_score
+            )
+            for job in top_jobs_notify:
                 title = job.get("jobtitle", "N/A")
                 city = job.get("city", "N/A")
                 state = job.get("stateprovince", "")
@@ -1083,28 +1265,27 @@ def save_job_results(
                         if summary:
                             summary_str = f"\n  <i>{summary}</i>"
                         reco = tier2.get("overall_recommendation", "")
-                        if reco == "apply":
-                            reco_str = '<font color="#28a745">Apply!</font> '
-                        elif reco == "consider":
-                            reco_str = '<font color="#ffc107">Consider</font> '
-                        else:
-                            reco_str = '<font color="#6c757d">Skip</font> '
+                        reco_str = NOTIFY_RECO_HTML.get(reco, NOTIFY_RECO_SKIP_HTML)
                     else:
                         summary_str = "\n  <i>Tier 2 analysis failed.</i>"
-                        reco_str = '<font color="#dc3545">Error</font> '
+                        reco_str = NOTIFY_RECO_ERROR_HTML
 
                 elif analysis and "error" in analysis:
                     score_str = "<b>(ERR)</b> "
                     summary_str = f"\n  <i>Error: {analysis.get('error')}</i>"
-                    reco_str = '<font color="#dc3545">Error</font> '
+                    reco_str = NOTIFY_RECO_ERROR_HTML
 
                 detail = f"• {reco_str}{score_str}{title} ({location})"
                 pay_min_str = job.get("payrate_min")
                 pay_max_str = job.get("payrate_max")
                 pay_period = job.get("payrate_period", "").lower()
-                if pay_min_str and pay_max_str and pay_period:
-                    with contextlib.suppress(ValueError, TypeError):
-                        detail += f"\n  ${int(float(pay_min_str)):,} - ${int(float(pay_max_str)):,}/{pay_period}"
+                if (
+                    pay_min_str
+                    and pay_max_str
+                    and pay_period
+                    and (pay_range := _format_pay_range(pay_min_str, pay_max_str))
+                ):
+                    detail += NOTIFY_PAY_TEMPLATE.format(pay_range=pay_range, pay_period=pay_period)
 
                 detail += summary_str
                 job_details_notify.append(detail)
@@ -1172,6 +1353,91 @@ def save_job_results(
         logger.info("Pushover notifications are disabled.")
 
 
+def _fetch_all_pages(
+    cookie_jar: RequestsCookieJar,
+    user_agent: str,
+    is_remote: bool,
+    stop_event: threading.Event,
+    start_delay: float = 0.0,
+) -> tuple[list[dict[str, Any]], int]:
+    """Page through one job stream (local or remote).
+
+    Returns the state-filtered jobs and the API's 'found' count (-1 if it couldn't be parsed).
+    Raises RuntimeError if a page can't be fetched, or if stop_event is set because the other
+    stream failed.
+    """
+    job_type_str = "Remote" if is_remote else "Local"
+    filtered_jobs: list[dict[str, Any]] = []
+    jobs_found_this_type = None
+    page_number = 1
+    if start_delay > 0:
+        logger.info("Staggering %s stream start by %.2fs.", job_type_str, start_delay)
+        stop_event.wait(start_delay)
+    while True:
+        if stop_event.is_set():
+            raise RuntimeError(f"{job_type_str} stream stopped because another stream failed.")
+        logger.info("--- Processing %s Page %d ---", job_type_str, page_number)
+        response_data = fetch_with_retry(
+            cookie_jar, user_agent, page_number, is_remote, stop_event=stop_event
+        )
+        if stop_event.is_set():
+            continue  # Abandoned mid-fetch; the check above raises without validating the session
+        if not response_data:
+            logger.warning(
+                "Fetch failed for %s page %d. Validating session.", job_type_str, page_number
+            )
+            if not validate_session(cookie_jar, user_agent):
+                raise RuntimeError("Session became invalid during pagination.")
+            else:
+                raise RuntimeError(
+                    f"Failed to fetch {job_type_str} page {page_number} despite valid session."
+                )
+
+        if jobs_found_this_type is None:
+            try:
+                jobs_found_this_type = int(response_data.get("found", 0))
+                logger.info(
+                    "API reports %d total %s jobs for period '%s'",
+                    jobs_found_this_type,
+                    job_type_str,
+                    JOB_POST_PERIOD,
+                )
+            except (ValueError, TypeError):
+                logger.warning("Could not parse 'found' count.")
+                jobs_found_this_type = -1
+
+        jobs_on_page = response_data.get("jobs", [])
+        if not jobs_on_page:
+            logger.info("No more %s jobs on page %d.", job_type_str, page_number)
+            break
+
+        logger.info(
+            "Received %d %s jobs on page %d.", len(jobs_on_page), job_type_str, page_number
+        )
+        filtered_jobs.extend(filter_jobs_by_state(jobs_on_page, FILTER_STATE))
+
+        if len(jobs_on_page) < 25:  # Assuming page size is 25
+            logger.info("Received less than page size. Assuming last %s page.", job_type_str)
+            break
+        if jobs_found_this_type >= 0:  # Check pagination limit
+            max_pages_expected = (jobs_found_this_type + 24) // 25
+            if page_number >= max_pages_expected:
+                logger.info(
+                    "Reached expected max %s page number (%d/%d). Stopping.",
+                    job_type_str,
+                    page_number,
+                    max_pages_expected,
+                )
+                break
+
+        page_number += 1
+        page_delay = random.uniform(PAGE_DELAY_MIN, PAGE_DELAY_MAX)
+        logger.debug("Waiting %.2fs before next %s page.", page_delay, job_type_str)
+        stop_event.wait(page_delay)
+
+    return filtered_jobs, jobs_found_this_type
+
+
 def scrape_roberthalf_jobs(analyze_all: bool = False, llm_debug: bool = False) -> None:
     """Main function to orchestrate the Robert Half job scraping."""
     logger.info("--- Starting Robert Half Job Scraper ---")
@@ -1208,103 +1474,70 @@ def scrape_roberthalf_jobs(analyze_all: bool = False, llm_debug: bool = False) -
         logger.info("AI Matching is disabled in configuration.")
 
     try:
-        # --- Get Session ---
-        session_info = get_or_refresh_session()
+        # --- Get Session (CSV history is read concurrently while a login may be running) ---
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            existing_ids_future = executor.submit(read_existing_job_data, CSV_FILE_PATH)
+            session_info = get_or_refresh_session()
+            existing_job_ids_csv = existing_ids_future.result()
         if not session_info:
             # Error already logged in get_or_refresh_session
             raise RuntimeError("Failed to establish a valid session. Exiting.")
         session_cookies, session_user_agent = session_info
-
-        all_filtered_jobs = []
-        total_jobs_api_reported = 0
-
-        # --- Fetch Jobs (Local and Remote) ---
-        for is_remote in [False, True]:
-            page_number = 1
-            jobs_found_this_type = None
-            while True:
-                job_type_str = "Remote" if is_remote else "Local"
-                logger.info(f"--- Processing {job_type_str} Page {page_number} ---")
-                response_data = fetch_with_retry(
-                    session_cookies, session_user_agent, page_number, is_remote
+        session_cookie_jar = build_cookie_jar(session_cookies)
+
+        # --- Fetch Jobs (Local and Remote streams run side by side) ---
+        # Each stream still pages sequentially with its own politeness delays, every API call
+        # goes through the shared rate limit, and the remote stream starts after the old
+        # local-to-remote switch delay so the two page timelines stay offset
+        stop_event = threading.Event()
+        remote_start_delay = random.uniform(PAGE_DELAY_MIN * 1.2, PAGE_DELAY_MAX * 1.2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stream_futures = [
+                executor.submit(
+                    _fetch_all_pages,
+                    session_cookie_jar,
+                    session_user_agent,
+                    is_remote,
+                    stop_event,
+                    remote_start_delay if is_remote else 0.0,
                 )
-                if not response_data:
-                    logger.warning(
-                        f"Fetch failed for {job_type_str} page {page_number}. Validating session."
-                    )
-                    if not validate_session(session_cookies, session_user_agent):
-                        raise RuntimeError("Session became invalid during pagination.")
-                    else:
-                        raise RuntimeError(
-                            f"Failed to fetch {job_type_str} page {page_number} despite valid session."
-                        )
-
-                if jobs_found_this_type is None:
-                    try:
-                        current_found = int(response_data.get("found", 0))
-                        jobs_found_this_type = current_found
-                        total_jobs_api_reported += current_found
-                        logger.info(
-                            f"API reports {current_found} total {job_type_str} jobs for period '{JOB_POST_PERIOD}'"
-                        )
-                    except (ValueError, TypeError):
-                        logger.warning("Could not parse 'found' count.")
-                        jobs_found_this_type = -1
-
-                jobs_on_page = response_data.get("jobs", [])
-                if not jobs_on_page:
-                    logger.info(f"No more {job_type_str} jobs on page {page_number}.")
-                    break
-
-                logger.info(
-                    f"Received {len(jobs_on_page)} {job_type_str} jobs on page {page_number}."
-                )
-                state_jobs_on_page = filter_jobs_by_state(jobs_on_page, FILTER_STATE)
-                all_filtered_jobs.extend(state_jobs_on_page)
-
-                if len(jobs_on_page) < 25:  # Assuming page size is 25
-                    logger.info("Received less than page size. Assuming last page.")
-                    break
-                if jobs_found_this_type >= 0:  # Check pagination limit
-                    max_pages_expected = (jobs_found_this_type + 24) // 25
-                    if page_number >= max_pages_expected:
-                        logger.info(
-                            f"Reached expected max page number ({page_number}/{max_pages_expected}). Stopping."
-                        )
-                        break
-
-                page_number += 1
-                page_delay = random.uniform(PAGE_DELAY_MIN, PAGE_DELAY_MAX)
-                logger.debug(f"Waiting {page_delay:.2f}s before next page.")
-                time.sleep(page_delay)
-
-            if not is_remote:
-                switch_delay = random.uniform(PAGE_DELAY_MIN * 1.2, PAGE_DELAY_MAX * 1.2)
-                logger.info(f"Finished local. Switching to remote. Waiting {switch_delay:.2f}s...")
-                time.sleep(switch_delay)
-
-        # --- Deduplicate Jobs ---
-        unique_jobs_dict = {}
+                for is_remote in (False, True)
+            ]
+            try:
+                done, _ = wait(stream_futures, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if (stream_error := future.exception()) is not None:
+                        raise stream_error
+                # Collect in submission order so local jobs win deduplication, as before
+                stream_results = [future.result() for future in stream_futures]
+            except BaseException:
+                # A stream failure or Ctrl+C stops the other stream (waking its sleeps) instead
+                # of the executor exit waiting for it to page to the end
+                stop_event.set()
+                raise
+
+        # --- Merge and Deduplicate Jobs (local first, so it wins on duplicates) ---
+        unique_jobs_dict: dict[str, dict[str, Any]] = {}
         duplicates_found = 0
-        for job in all_filtered_jobs:
-            job_id = job.get("unique_job_number")
-            if job_id:
-                if job_id not in unique_jobs_dict:
-                    unique_jobs_dict[job_id] = job
+        total_jobs_api_reported = 0
+        for stream_jobs, stream_found in stream_results:
+            total_jobs_api_reported += max(stream_found, 0)
+            for job in stream_jobs:
+                job_id = job.get("unique_job_number")
+                if job_id:
+                    if job_id not in unique_jobs_dict:
+                        unique_jobs_dict[job_id] = job
+                    else:
+                        duplicates_found += 1
                 else:
-                    duplicates_found += 1
-            else:
-                logger.warning("Job found without unique_job_number.")
+                    logger.warning("Job found without unique_job_number.")
         unique_job_list = list(unique_jobs_dict.values())
         logger.info(
             f"Total unique jobs found: {len(unique_job_list)} (Removed {duplicates_found} duplicates)."
         )
 
         # --- Process and Save Results ---
-        existing_job_ids_csv = read_existing_job_data(CSV_FILE_PATH)
-        new_job_ids = {
-            job.get("unique_job_number") for job in unique_job_list if job.get("unique_job_number")
-        } - existing_job_ids_csv
+        new_job_ids = unique_jobs_dict.keys() - existing_job_ids_csv
         logger.info(f"Identified {len(new_job_ids)} new jobs compared to CSV history.")
 
         # Pass analyzer instance, new_job_ids, AND the analyze_all flag to save_job_results
@@ -1378,9 +1611,14 @@ def append_job_data_to_csv(
         "Pay Rate",
         "Job URL",
     ]
-    new_jobs_added_count = 0
     is_new_file = not csv_file_path.exists() or csv_file_path.stat().st_size == 0
 
+    # Filter before building rows; a job ID repeated within this run keeps its first entry
+    new_jobs: dict[str, dict[str, Any]] = {}
+    for job in jobs:
+        if (job_id := job.get("unique_job_number")) and job_id not in existing_job_ids:
+            new_jobs.setdefault(job_id, job)
+
     try:
         with open(csv_file_path, mode="a", newline="", encoding="utf-8") as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -1388,50 +1626,45 @@ def append_job_data_to_csv(
                 writer.writeheader()
                 logger.info(f"Created or wrote header to new CSV: {csv_file_path}")
 
-            for job in jobs:
-                job_id = job.get("unique_job_number")
-                # Check if job_id exists AND if it's not already in the set read at the start
-                if job_id and job_id not in existing_job_ids:
-                    pay_min_str = job.get("payrate_min")
-                    pay_max_str = job.get("payrate_max")
-                    pay_period = job.get("payrate_period", "")
-                    pay_rate = "N/A"
-                    if pay_min_str and pay_max_str and pay_period:
-                        try:
-                            pay_rate = f"${int(float(pay_min_str)):,} - ${int(float(pay_max_str)):,}/{pay_period}"
-                        except (ValueError, TypeError):
-                            pay_rate = f"{pay_min_str}-{pay_max_str}/{pay_period}"
-
-                    writer.writerow(
-                        {
-                            "Job ID": job_id,
-                            "Job Title": job.get("jobtitle", "N/A"),
-                            "Date First Seen (UTC)": datetime.now(UTC)
-                            .isoformat(timespec="seconds")
-                            .replace("+00:00", "Z"),
-                            "Date Posted": job.get("date_posted", "N/A"),
-                            "Location": f"{job.get('city', 'N/A')}, {job.get('stateprovince', 'N/A')}"
-                            if job.get("remote", "").lower() != "yes"
-                            else "Remote (US)",
-                            "Company Name": job.get(
-                                "source", "N/A"
-                            ),  # Or a better field if available
-                            "Pay Rate": pay_rate,
-                            "Job URL": job.get("job_detail_url", "N/A"),
-                        }
-                    )
-                    new_jobs_added_count += 1
-                    existing_job_ids.add(
-                        job_id
-                    )  # Add to set immediately to prevent duplicates within the same run if job appears twice
+            first_seen = datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+            writer.writerows(
+                _build_csv_row(job_id, job, first_seen) for job_id, job in new_jobs.items()
+            )
+            existing_job_ids.update(new_jobs)
 
-        if new_jobs_added_count > 0:
-            logger.info(f"Appended {new_jobs_added_count} new job entries to {csv_file_path}")
+        if new_jobs:
+            logger.info(f"Appended {len(new_jobs)} new job entries to {csv_file_path}")
 
     except Exception as e:
         logger.error(f"Error writing to CSV file {csv_file_path}: {e}")
 
 
+def _build_csv_row(job_id: str, job: dict[str, Any], first_seen: str) -> dict[str, str]:
+    """Build a single CSV row for a job that has not been seen before."""
+    pay_min_str = job.get("payrate_min")
+    pay_max_str = job.get("payrate_max")
+    pay_period = job.get("payrate_period", "")
+    pay_rate = "N/A"
+    if pay_min_str and pay_max_str and pay_period:
+        if pay_range := _format_pay_range(pay_min_str, pay_max_str):
+            pay_rate = f"{pay_range}/{pay_period}"
+        else:
+            pay_rate = f"{pay_min_str}-{pay_max_str}/{pay_period}"
+
+    return {
+        "Job ID": job_id,
+        "Job Title": job.get("jobtitle", "N/A"),
+        "Date First Seen (UTC)": first_seen,
+        "Date Posted": job.get("date_posted", "N/A"),
+        "Location": f"{job.get('city', 'N/A')}, {job.get('stateprovince', 'N/A')}"
+        if job.get("remote", "").lower() != "yes"
+        else "Remote (US)",
+        "Company Name": job.get("source", "N/A"),  # Or a better field if available
+        "Pay Rate": pay_rate,
+        "Job URL": job.get("job_detail_url", "N/A"),
+    }
+
+
 # --- Main Execution ---
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
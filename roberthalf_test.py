@@ -24,12 +24,13 @@ def test_roberthalf_page():
             context = browser.new_context(proxy=proxy_config)
             page = context.new_page()
 
-            # Navigate to Robert Half jobs page
+            # Navigate to Robert Half jobs page and wait for the job search API
+            # response (analytics pings keep the page from ever going network idle)
             print("Navigating to Robert Half jobs page...")
-            page.goto("https://www.roberthalf.com/us/en/jobs?city=Dallas&lobid=RHT")
-
-            # Wait for the page to load
-            page.wait_for_load_state('networkidle')
+            with page.expect_response(
+                lambda response: "jobSearchServlet" in response.url and response.ok
+            ):
+                page.goto("https://www.roberthalf.com/us/en/jobs?city=Dallas&lobid=RHT")
 
             # Take a snapshot of the page structure
             print("\nTaking accessibility snapshot...")
@@ -1,12 +1,15 @@
 import logging
 import os
+from typing import TYPE_CHECKING
 
-from playwright.sync_api import ProxySettings
+if TYPE_CHECKING:
+    # Type-only import: loading Playwright is slow and callers that only use requests don't need it
+    from playwright.sync_api import ProxySettings
 
 logger = logging.getLogger(__name__)
 
 
-def get_proxy_config() -> ProxySettings | None:  # Changed return type
+def get_proxy_config() -> "ProxySettings | None":  # Changed return type
     """
     Creates proxy configuration dictionary for Playwright/requests
     based on environment variables.
@@ -33,7 +36,9 @@ def get_proxy_config() -> ProxySettings | None:  # Changed return type
 
     try:
         # Split only on the first colon to handle passwords potentially containing colons
-        username, password = proxy_auth.split(":", 1)
+        username, separator, password = proxy_auth.partition(":")
+        if not separator:
+            raise ValueError("PROXY_AUTH has no ':' separator")
 
         # Ensure scheme is present for Playwright, default to http
         server_url = proxy_server
@@ -42,8 +47,8 @@ def get_proxy_config() -> ProxySettings | None:  # Changed return type
             server_url = f"http://{proxy_server}"
             logger.debug(f"Prepending 'http://' to proxy server. Final server URL: {server_url}")
 
-        # Use dict type hint here
-        config: dict[str, str] = {
+        # ProxySettings is a TypedDict, so a plain dict literal satisfies it at runtime
+        config: ProxySettings = {
             "server": server_url,
             "username": username,
             "password": password,
@@ -56,7 +61,7 @@ def get_proxy_config() -> ProxySettings | None:  # Changed return type
         logger.info(
             f"Proxy enabled: Server={config['server']}, User={config['username']}, Bypass={config.get('bypass', 'N/A')}"
         )
-        return ProxySettings(**config)
+        return config
 
     except ValueError:
         # Specific error if proxy_auth doesn't contain ':'